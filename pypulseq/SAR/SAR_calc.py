@@ -3,7 +3,6 @@ from pathlib import Path
 from typing import Tuple
 from typing import Union
 
-import matplotlib.pyplot as plt
 import numpy as np
 import scipy.io as sio
 from scipy import interpolate
@@ -309,6 +308,8 @@ def calc_SAR(file: Union[str, Path, Sequence]) -> None:
 
     # Plot 10 sec average SAR
     if tsec[-1] > 10:
+        import matplotlib.pyplot as plt
+
         plt.plot(tsec, SAR_wbg_tensec, "x-", label="Whole Body: 10sec")
         plt.plot(tsec, SAR_hg_tensec, ".-", label="Head only: 10sec")
 
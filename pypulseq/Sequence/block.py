@@ -262,18 +262,16 @@ def get_block(self, block_index: int) -> SimpleNamespace:
     if self.use_block_cache and block_index in self.block_cache:
         return self.block_cache[block_index]
 
-    block = SimpleNamespace()
-    attrs = ["block_duration", "rf", "gx", "gy", "gz", "adc", "label"]
-    values = [None] * len(attrs)
-    for att, val in zip(attrs, values):
-        setattr(block, att, val)
+    block = SimpleNamespace(
+        block_duration=None, rf=None, gx=None, gy=None, gz=None, adc=None, label=None
+    )
     event_ind = self.block_events[block_index]
 
     if event_ind[0] > 0:  # Delay
-        delay = SimpleNamespace()
-        delay.type = "delay"
-        delay.delay = self.delay_library.data[event_ind[0]][0]
-        block.delay = delay
+        # Library data was validated on insertion, build the event directly
+        block.delay = SimpleNamespace(
+            type="delay", delay=self.delay_library.data[event_ind[0]][0]
+        )
 
     if event_ind[1] > 0:  # RF
         if event_ind[1] in self.rf_library.type:
@@ -341,18 +339,15 @@ def get_block(self, block_index: int) -> SimpleNamespace:
     if event_ind[5] > 0:
         lib_data = self.adc_library.data[event_ind[5]]
 
-        adc = SimpleNamespace()
-        (
-            adc.num_samples,
-            adc.dwell,
-            adc.delay,
-            adc.freq_offset,
-            adc.phase_offset,
-            adc.dead_time,
-        ) = [lib_data[x] for x in range(6)]
-        adc.num_samples = int(adc.num_samples)
-        adc.type = "adc"
-        block.adc = adc
+        block.adc = SimpleNamespace(
+            num_samples=int(lib_data[0]),
+            dwell=lib_data[1],
+            delay=lib_data[2],
+            freq_offset=lib_data[3],
+            phase_offset=lib_data[4],
+            dead_time=lib_data[5],
+            type="adc",
+        )
 
     # Triggers
     if event_ind[6] > 0:
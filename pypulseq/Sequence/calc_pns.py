@@ -2,7 +2,6 @@ import math
 from types import SimpleNamespace
 from typing import Tuple, List
 
-import matplotlib.pyplot as plt
 import pypulseq as pp
 import numpy as np
 
@@ -48,6 +47,7 @@ def calc_pns(
     t_pns : np.array [N]
         Time axis for the pns_norm and pns_components arrays
     """
+    import matplotlib.pyplot as plt
     
     dt = obj.grad_raster_time
     # Get gradients as piecewise-polynomials
@@ -6,13 +6,11 @@ from typing import Tuple, List
 from typing import Union
 from warnings import warn
 
-import matplotlib as mpl
 import numpy as np
 from scipy.interpolate import PPoly
-from matplotlib import pyplot as plt
 
 from pypulseq import eps
-from pypulseq.Sequence import block, parula
+from pypulseq.Sequence import block
 from pypulseq.Sequence.ext_test_report import ext_test_report
 from pypulseq.Sequence.read_seq import read
 from pypulseq.Sequence.write_seq import write as write_seq
@@ -127,13 +125,9 @@ class Sequence:
             Contains frequency and phase offsets of each ADC object (not samples).
         """
 
-        # Collect ADC timing data
-        t_adc = []
-        fp_adc = []
-
         curr_dur = 0
         if time_range == None:
-            blocks = self.block_events
+            blocks = list(self.block_events)
         else:
             if len(time_range) != 2:
                 raise ValueError('Time range must be list of two elements')
@@ -150,26 +144,33 @@ class Sequence:
             blocks = list(self.block_durations.keys())[begin_block:end_block]
             curr_dur = t[begin_block] - bd[begin_block]
             
-        for block_counter in blocks:
-            block = self.get_block(block_counter)
-            
-            if block.adc is not None:  # ADC
-                t_adc.append(
-                    (np.arange(block.adc.num_samples) + 0.5) * block.adc.dwell
-                    + block.adc.delay
-                    + curr_dur
-                )
-                fp_adc.append([block.adc.freq_offset, block.adc.phase_offset])
-
-            curr_dur += self.block_durations[block_counter]
-        
-        if t_adc == []:
+        # Read the ADC events straight from the library instead of decoding every block with `get_block`, and
+        # evaluate the sample times of all ADCs at once on the columns of their parameters
+        adc_ids = [self.block_events[block_counter][5] for block_counter in blocks]
+        if not any(adc_ids):
             # If there are no ADCs, make sure the output is the right shape
-            t_adc = np.zeros(0)
-            fp_adc = np.zeros((0,2))
-        else:
-            t_adc = np.concatenate(t_adc)
-            fp_adc = np.array(fp_adc)
+            return np.zeros(0), np.zeros((0, 2))
+
+        durations = [self.block_durations[block_counter] for block_counter in blocks]
+        block_starts = np.cumsum([curr_dur] + durations[:-1])  # Start time of each block
+
+        has_adc = np.array(adc_ids) > 0
+        adc_rows = [self.adc_library.data[adc_id] for adc_id in adc_ids if adc_id > 0]
+        adc_data = np.array(adc_rows)
+        num_samples = adc_data[:, 0].astype(int)
+        dwell = adc_data[:, 1]
+        delay = adc_data[:, 2]
+
+        # Index of each sample within its ADC
+        sample_idx = np.arange(num_samples.sum()) - np.repeat(np.cumsum(num_samples) - num_samples, num_samples)
+        t_adc = (
+            (sample_idx + 0.5) * np.repeat(dwell, num_samples)
+            + np.repeat(delay, num_samples)
+            + np.repeat(block_starts[has_adc], num_samples)
+        )
+        # Built from the library rows rather than `adc_data`, which is promoted to float, to keep the type of the
+        # offsets as stored (e.g. integer offsets)
+        fp_adc = np.array([row[3:5] for row in adc_rows])
 
         return t_adc, fp_adc
 
@@ -884,6 +885,11 @@ class Sequence:
         plot_type : str, default='Gradient'
             Gradients display type, must be one of either 'Gradient' or 'Kspace'.
         """
+        import matplotlib as mpl
+        from matplotlib import pyplot as plt
+
+        from pypulseq.Sequence import parula
+
         mpl.rcParams["lines.linewidth"] = 0.75  # Set default Matplotlib linewidth
 
         valid_time_units = ["s", "ms", "us"]
@@ -920,6 +926,8 @@ class Sequence:
         g_factor = g_factor_list[valid_grad_units.index(grad_disp)]
 
         t0 = 0
+        t_adc_all = []  # ADC sample times and phases, plotted at once after the block loop
+        phase_adc_all = []
         label_defined = False
         label_idx_to_plot = []
         label_legend_to_plot = []
@@ -965,15 +973,12 @@ class Sequence:
                     # From Pulseq: According to the information from Klaus Scheffler and indirectly from Siemens this
                     # is the present convention - the samples are shifted by 0.5 dwell
                     t = adc.delay + (np.arange(int(adc.num_samples)) + 0.5) * adc.dwell
-                    sp11.plot(t_factor * (t0 + t), np.zeros(len(t)), "rx")
-                    sp13.plot(
-                        t_factor * (t0 + t),
+                    t_adc_all.append(t0 + t)
+                    phase_adc_all.append(
                         np.angle(
                             np.exp(1j * adc.phase_offset)
                             * np.exp(1j * 2 * np.pi * t * adc.freq_offset)
-                        ),
-                        "b.",
-                        markersize=0.25,
+                        )
                     )
 
                     if label_defined and len(label_idx_to_plot) != 0:
@@ -1048,6 +1053,12 @@ class Sequence:
                         fig2_subplots[x].plot(t_factor * (t0 + time), waveform)
             t0 += self.block_durations[block_counter]
 
+        # A single line per axis for all ADC samples, instead of one per ADC event
+        if len(t_adc_all) != 0:
+            t_adc_all = t_factor * np.concatenate(t_adc_all)
+            sp11.plot(t_adc_all, np.zeros_like(t_adc_all), "rx")
+            sp13.plot(t_adc_all, np.concatenate(phase_adc_all), "b.", markersize=0.25)
+
         grad_plot_labels = ["x", "y", "z"]
         sp11.set_ylabel("ADC")
         sp12.set_ylabel("RF mag (Hz)")
@@ -1433,7 +1444,7 @@ class Sequence:
                                 shape_pieces[j].append(_temp)
                             else:
                                 if abs(grad.amplitude) > eps:
-                                    print('Warning: "empty" gradient with non-zero magnitude detected in block {}'.format(block_counter))
+                                    warn(f'"Empty" gradient with non-zero magnitude detected in block {block_counter}')
 
             if block.rf is not None:  # RF
                 rf = block.rf
@@ -1564,18 +1575,20 @@ class Sequence:
             raise ValueError("Invalid time range")
 
         t0 = 0
-        adc_t_all = np.array([])
-        adc_signal_all = np.array([], dtype=complex)
-        rf_t_all = np.array([])
-        rf_signal_all = np.array([], dtype=complex)
-        rf_t_centers = np.array([])
-        rf_signal_centers = np.array([], dtype=complex)
-        gx_t_all = np.array([])
-        gy_t_all = np.array([])
-        gz_t_all = np.array([])
-        gx_all = np.array([])
-        gy_all = np.array([])
-        gz_all = np.array([])
+        # Collect the waveform pieces of all blocks in lists and concatenate them once at the end; concatenating
+        # inside the block loop would copy the accumulated arrays for every block
+        adc_t_all = [np.array([])]
+        adc_signal_all = [np.array([], dtype=complex)]
+        rf_t_all = [np.array([])]
+        rf_signal_all = [np.array([], dtype=complex)]
+        rf_t_centers = [np.array([])]
+        rf_signal_centers = [np.array([], dtype=complex)]
+        gx_t_all = [np.array([])]
+        gy_t_all = [np.array([])]
+        gz_t_all = [np.array([])]
+        gx_all = [np.array([])]
+        gy_all = [np.array([])]
+        gz_all = [np.array([])]
 
         for block_counter in self.block_events:  # For each block
             block = self.get_block(block_counter)  # Retrieve it
@@ -1593,8 +1606,8 @@ class Sequence:
                     adc_signal = np.exp(1j * adc.phase_offset) * np.exp(
                         1j * 2 * np.pi * t * adc.freq_offset
                     )
-                    adc_t_all = np.concatenate((adc_t_all, adc_t))
-                    adc_signal_all = np.concatenate((adc_signal_all, adc_signal))
+                    adc_t_all.append(adc_t)
+                    adc_signal_all.append(adc_signal)
 
                 if block.rf != None:
                     rf = block.rf
@@ -1616,10 +1629,10 @@ class Sequence:
                         * np.exp(1j * rf.phase_offset)
                         * np.exp(1j * 2 * math.pi * rf.t * rf.freq_offset)
                     )
-                    rf_t_all = np.concatenate((rf_t_all, rf_t))
-                    rf_signal_all = np.concatenate((rf_signal_all, rf))
-                    rf_t_centers = np.concatenate((rf_t_centers, [rf_t[ic]]))
-                    rf_signal_centers = np.concatenate((rf_signal_centers, [rf[ic]]))
+                    rf_t_all.append(rf_t)
+                    rf_signal_all.append(rf)
+                    rf_t_centers.append([rf_t[ic]])
+                    rf_signal_centers.append([rf[ic]])
 
                 grad_channels = ["gx", "gy", "gz"]
                 for x in range(
@@ -1651,32 +1664,32 @@ class Sequence:
                             g = 1e-3 * grad.amplitude * np.array([0, 0, 1, 1, 0])
 
                         if grad.channel == "x":
-                            gx_t_all = np.concatenate((gx_t_all, g_t))
-                            gx_all = np.concatenate((gx_all, g))
+                            gx_t_all.append(g_t)
+                            gx_all.append(g)
                         elif grad.channel == "y":
-                            gy_t_all = np.concatenate((gy_t_all, g_t))
-                            gy_all = np.concatenate((gy_all, g))
+                            gy_t_all.append(g_t)
+                            gy_all.append(g)
                         elif grad.channel == "z":
-                            gz_t_all = np.concatenate((gz_t_all, g_t))
-                            gz_all = np.concatenate((gz_all, g))
+                            gz_t_all.append(g_t)
+                            gz_all.append(g)
 
             t0 += self.block_durations[
                 block_counter
             ]  # "Current time" gets updated to end of block just examined
 
         all_waveforms = {
-            "t_adc": adc_t_all,
-            "t_rf": rf_t_all,
-            "t_rf_centers": rf_t_centers,
-            "t_gx": gx_t_all,
-            "t_gy": gy_t_all,
-            "t_gz": gz_t_all,
-            "adc": adc_signal_all,
-            "rf": rf_signal_all,
-            "rf_centers": rf_signal_centers,
-            "gx": gx_all,
-            "gy": gy_all,
-            "gz": gz_all,
+            "t_adc": np.concatenate(adc_t_all),
+            "t_rf": np.concatenate(rf_t_all),
+            "t_rf_centers": np.concatenate(rf_t_centers),
+            "t_gx": np.concatenate(gx_t_all),
+            "t_gy": np.concatenate(gy_t_all),
+            "t_gz": np.concatenate(gz_t_all),
+            "adc": np.concatenate(adc_signal_all),
+            "rf": np.concatenate(rf_signal_all),
+            "rf_centers": np.concatenate(rf_signal_centers),
+            "gx": np.concatenate(gx_all),
+            "gy": np.concatenate(gy_all),
+            "gz": np.concatenate(gz_all),
             "grad_unit": "[kHz/m]",
             "rf_unit": "[Hz]",
             "time_unit": "[seconds]",
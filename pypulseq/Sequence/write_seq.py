@@ -69,14 +69,18 @@ def write(self, file_name: Union[str, Path], create_signature) -> None:
         output_file.write("[BLOCKS]\n")
         id_format_width = "{:" + str(len(str(len(self.block_events)))) + "d}"
         id_format_str = id_format_width + " {:3d} {:3d} {:3d} {:3d} {:3d} {:2d} {:2d}\n"
-        for block_counter in self.block_events:
-            block_duration = (
-                self.block_durations[block_counter] / self.block_duration_raster
-            )
-            block_duration_rounded = round(block_duration)
 
-            assert abs(block_duration_rounded - block_duration) < 1e-6
+        # Convert and check all block durations against the block duration raster in one pass
+        block_durations = (
+            np.array([self.block_durations[block_counter] for block_counter in self.block_events])
+            / self.block_duration_raster
+        )
+        block_durations_rounded = np.round(block_durations)
+        assert np.all(np.abs(block_durations_rounded - block_durations) < 1e-6)
 
+        for block_counter, block_duration_rounded in zip(
+            self.block_events, block_durations_rounded.astype(int).tolist()
+        ):
             s = id_format_str.format(
                 *(
                     block_counter,
@@ -17,10 +17,8 @@ def block_to_events(*args: SimpleNamespace) -> Tuple[SimpleNamespace, ...]:
         List of events comprising `args` if it was a block, otherwise `args` unmodified.
     """
     if len(args) == 1 and hasattr(args[0], 'rf'):
-        events = list(vars(args[0]).values())  # Get all attrs
-        events = list(
-            filter(lambda filter_none: filter_none is not None, events)
-        )  # Filter None attributes
+        # Get all attrs, filtering None attributes
+        events = [e for e in vars(args[0]).values() if e is not None]
         events = __get_label_events_if_any(
             *events
         )  # Flatten label events from dict datatype
@@ -1,4 +1,5 @@
 from typing import Tuple
+from warnings import warn
 
 import numpy as np
 
@@ -163,7 +164,7 @@ def calc_ramp(
             elif okSgl[ii] == 1:
                 k_left[ii] = kgl[ii]
             else:
-                print("Unknown error")
+                warn("calc_ramp: unknown error while joining k-space points")
 
         success, k = __joinright1(
             k0=k_left,
@@ -293,7 +294,7 @@ def calc_ramp(
             elif okSgl[ii] == 1:
                 k_right[ii] = kgl[ii]
             else:
-                print("Unknown error")
+                warn("calc_ramp: unknown error while joining k-space points")
 
         success, k = __joinleft1(
             k0=k0,
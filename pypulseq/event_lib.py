@@ -28,6 +28,8 @@ class EventLibrary:
         Key-value pairs of data values and corresponding event keys.
     """
 
+    __slots__ = ("data", "type", "keymap", "next_free_ID", "numpy_data")
+
     def __init__(self, numpy_data=False):
         self.data = dict()
         self.type = dict()
@@ -42,28 +42,22 @@ def make_adc(
     ValueError
         If neither `dwell` nor `duration` are defined.
     """
+    if (dwell == 0 and duration == 0) or (dwell > 0 and duration > 0):
+        raise ValueError("Either dwell or duration must be defined")
+
     if system == None:
         system = Opts.default
-        
+
     adc = SimpleNamespace()
     adc.type = "adc"
     adc.num_samples = num_samples
-    adc.dwell = dwell
-    adc.delay = delay
+    adc.dwell = duration / num_samples if duration > 0 else dwell
+    adc.delay = max(delay, system.adc_dead_time)
     adc.freq_offset = freq_offset
     adc.phase_offset = phase_offset
     adc.dead_time = system.adc_dead_time
 
-    if (dwell == 0 and duration == 0) or (dwell > 0 and duration > 0):
-        raise ValueError("Either dwell or duration must be defined")
-
-    if duration > 0:
-        adc.dwell = duration / num_samples
-
     if dwell > 0:
         adc.duration = dwell * num_samples
 
-    if adc.dead_time > adc.delay:
-        adc.delay = adc.dead_time
-
     return adc
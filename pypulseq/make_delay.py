@@ -1,4 +1,4 @@
-import numpy as np
+import math
 from types import SimpleNamespace
 
 
@@ -23,7 +23,7 @@ def make_delay(d: float) -> SimpleNamespace:
     """
 
     delay = SimpleNamespace()
-    if not np.isfinite(d) or d < 0:
+    if not math.isfinite(d) or d < 0:
         raise ValueError("Delay {:.2f} ms is invalid".format(d * 1e3))
     delay.type = "delay"
     delay.delay = d
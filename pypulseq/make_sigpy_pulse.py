@@ -5,7 +5,6 @@ from copy import copy
 
 import numpy as np
 import sigpy.mri.rf as rf
-import sigpy.plot as pl
 
 from pypulseq.make_trapezoid import make_trapezoid
 from pypulseq.opts import Opts
@@ -25,7 +24,7 @@ def sigpy_n_seq(
     slice_thickness: float = 0,
     system: Opts = None,
     time_bw_product: float = 4,
-    pulse_cfg: SigpyPulseOpts = SigpyPulseOpts(),
+    pulse_cfg: SigpyPulseOpts = None,
     use: str = str(),
     plot: bool = True,
 ) -> Union[SimpleNamespace, Tuple[SimpleNamespace, SimpleNamespace, SimpleNamespace]]:
@@ -62,6 +61,8 @@ def sigpy_n_seq(
         System limits. Default is a system limits object initialised to default values.
     time_bw_product : float, optional, default=4
         Time-bandwidth product.
+    pulse_cfg : SigpyPulseOpts, optional
+        Sigpy pulse design options. Default is a pulse options object initialised to default values.
     use : str, optional, default=str()
         Use of radio-frequency sinc pulse. Must be one of 'excitation', 'refocusing' or 'inversion'.
     plot: bool, optional, default=True
@@ -84,7 +85,10 @@ def sigpy_n_seq(
     """
     if system == None:
         system = Opts.default
-        
+
+    if pulse_cfg == None:
+        pulse_cfg = SigpyPulseOpts()
+
     valid_use_pulses = ["excitation", "refocusing", "inversion"]
     if use != "" and use not in valid_use_pulses:
         raise ValueError(
@@ -179,12 +183,15 @@ def make_slr(
     time_bw_product: float = 4,
     duration: float = 0,
     system: Opts = None,
-    pulse_cfg: SigpyPulseOpts = SigpyPulseOpts(),
+    pulse_cfg: SigpyPulseOpts = None,
     disp: bool = False,
 ):
     if system == None:
         system = Opts.default
-        
+
+    if pulse_cfg == None:
+        pulse_cfg = SigpyPulseOpts()
+
     N = int(round(duration / 1e-6))
     t = np.arange(1, N + 1) * system.rf_raster_time
 
@@ -208,6 +215,8 @@ def make_slr(
     signal = pulse * flip_angle / flip
 
     if disp:
+        import sigpy.plot as pl
+
         pl.LinePlot(pulse)
         pl.LinePlot(signal)
 
@@ -230,12 +239,15 @@ def make_sms(
     time_bw_product: float = 4,
     duration: float = 0,
     system: Opts = None,
-    pulse_cfg: SigpyPulseOpts = SigpyPulseOpts(),
+    pulse_cfg: SigpyPulseOpts = None,
     disp: bool = False,
 ):
     if system == None:
         system = Opts.default
-        
+
+    if pulse_cfg == None:
+        pulse_cfg = SigpyPulseOpts()
+
     N = int(round(duration / 1e-6))
     t = np.arange(1, N + 1) * system.rf_raster_time
 
@@ -266,6 +278,8 @@ def make_sms(
     signal = pulse * flip_angle / flip
 
     if disp:
+        import sigpy.plot as pl
+
         pl.LinePlot(pulse_in)
         pl.LinePlot(pulse)
         pl.LinePlot(signal)
@@ -0,0 +1,49 @@
+"""Tests for the check_timing.py module
+"""
+
+import numpy as np
+import pytest
+
+from pypulseq import Opts, make_delay, make_trapezoid
+from pypulseq.check_timing import check_timing, __div_check
+
+
+@pytest.mark.parametrize(
+    "a, b, expected",
+    [
+        (30e-6, 10e-6, True),  # Exact multiple
+        ((3 + 1e-10) * 10e-6, 10e-6, True),  # Within tolerance
+        ((3 + 1e-8) * 10e-6, 10e-6, False),  # Off by 1e-8 raster units
+        (15e-6, 10e-6, False),
+        (100.0, 1e-6, True),  # Large multiple
+        (np.array(30e-6), 10e-6, True),  # 0-d ndarray
+        (np.array(15e-6), np.array(10e-6), False),
+    ],
+)
+def test_div_check(a, b, expected):
+    assert __div_check(a, b) == expected
+
+
+def test_check_timing_float():
+    system = Opts()
+
+    is_ok, text_err, total_duration = check_timing(system, make_delay(1e-3))
+    assert is_ok
+    assert text_err == ""
+    assert total_duration == 1e-3
+
+    is_ok, _, _ = check_timing(system, make_delay(1e-3 + 1e-8))
+    assert not is_ok
+
+
+def test_check_timing_ndarray():
+    system = Opts()
+
+    is_ok, _, _ = check_timing(system, make_delay(np.array(1e-3)))
+    assert is_ok
+
+    trap = make_trapezoid(
+        channel="x", amplitude=1e5, flat_time=np.array(1e-3), rise_time=1e-4
+    )
+    is_ok, _, _ = check_timing(system, trap)
+    assert is_ok
@@ -0,0 +1,47 @@
+"""Tests for the make_adc.py module
+"""
+
+import pytest
+
+from pypulseq import make_adc, Opts
+
+
+def test_dwell_and_duration_error():
+
+    with pytest.raises(
+            ValueError,
+            match=r"Either dwell or duration must be defined"):
+        make_adc(num_samples=64)
+
+    with pytest.raises(
+            ValueError,
+            match=r"Either dwell or duration must be defined"):
+        make_adc(num_samples=64, dwell=10e-6, duration=640e-6)
+
+
+def test_dwell():
+    adc = make_adc(num_samples=64, dwell=10e-6)
+
+    assert adc.type == "adc"
+    assert adc.num_samples == 64
+    assert adc.dwell == 10e-6
+    assert adc.duration == pytest.approx(640e-6)
+    assert adc.delay == 0
+
+
+def test_duration():
+    adc = make_adc(num_samples=64, duration=640e-6)
+
+    assert adc.dwell == pytest.approx(10e-6)
+    assert adc.dwell * adc.num_samples == pytest.approx(640e-6)
+
+
+def test_dead_time_delay():
+    system = Opts(adc_dead_time=10e-6)
+
+    adc = make_adc(num_samples=64, dwell=10e-6, system=system)
+    assert adc.dead_time == 10e-6
+    assert adc.delay == 10e-6
+
+    adc = make_adc(num_samples=64, dwell=10e-6, delay=20e-6, system=system)
+    assert adc.delay == 20e-6
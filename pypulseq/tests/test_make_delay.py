@@ -0,0 +1,23 @@
+"""Tests for the make_delay.py module
+"""
+
+import numpy as np
+import pytest
+
+from pypulseq import make_delay
+
+
+def test_delay():
+    delay = make_delay(1e-3)
+
+    assert delay.type == "delay"
+    assert delay.delay == 1e-3
+
+
+@pytest.mark.parametrize("d", [-1e-3, np.inf, np.nan])
+def test_invalid_delay_error(d):
+
+    with pytest.raises(
+            ValueError,
+            match=r"Delay .* ms is invalid"):
+        make_delay(d)
@@ -6,13 +6,27 @@ Will Clarke, University of Oxford, 2023
 
 from types import SimpleNamespace
 
+import numpy as np
 import pytest
 from unittest.mock import patch
 
-from pypulseq import Sequence
+from pypulseq import Opts, Sequence
+from pypulseq import make_adc
+from pypulseq import make_delay
 from pypulseq import make_gauss_pulse
 
 
+def test_default_system():
+    default_max_grad = Opts.default.max_grad
+
+    seq = Sequence()
+    assert seq.system.max_grad == default_max_grad
+
+    seq.system.max_grad = 2 * default_max_grad
+    assert Opts.default.max_grad == default_max_grad
+    assert Sequence().system.max_grad == default_max_grad
+
+
 @patch("matplotlib.pyplot.show")
 def test_plot(mock_show):
     seq = Sequence()
@@ -21,3 +35,48 @@ def test_plot(mock_show):
     assert seq.plot() is None
 
     assert seq.plot(show_blocks=True) is None
+
+
+def test_adc_times():
+    seq = Sequence()
+    seq.add_block(make_delay(100e-6))
+    seq.add_block(make_adc(num_samples=4, dwell=10e-6, delay=20e-6))
+    seq.add_block(make_delay(30e-6))
+    seq.add_block(make_adc(num_samples=2, dwell=20e-6, freq_offset=100, phase_offset=0.5))
+
+    t_adc, fp_adc = seq.adc_times()
+    np.testing.assert_allclose(t_adc, [125e-6, 135e-6, 145e-6, 155e-6, 200e-6, 220e-6])
+    np.testing.assert_allclose(fp_adc, [[0, 0], [100, 0.5]])
+    assert fp_adc.dtype == np.float64
+
+    t_adc, fp_adc = seq.adc_times(time_range=[170e-6, 1])
+    np.testing.assert_allclose(t_adc, [200e-6, 220e-6])
+    np.testing.assert_allclose(fp_adc, [[100, 0.5]])
+
+
+def test_adc_times_integer_offsets():
+    seq = Sequence()
+    seq.add_block(make_adc(num_samples=4, dwell=10e-6))
+    seq.add_block(make_adc(num_samples=2, dwell=10e-6, freq_offset=100))
+
+    _, fp_adc = seq.adc_times()
+    np.testing.assert_array_equal(fp_adc, [[0, 0], [100, 0]])
+    assert fp_adc.dtype == np.array([[0, 0]]).dtype  # Integer offsets keep their type
+
+
+def test_adc_times_no_adc():
+    seq = Sequence()
+    seq.add_block(make_delay(100e-6))
+
+    t_adc, fp_adc = seq.adc_times()
+    assert t_adc.shape == (0,)
+    assert fp_adc.shape == (0, 2)
+
+
+@patch("matplotlib.pyplot.show")
+def test_plot_adc(mock_show):
+    seq = Sequence()
+    seq.add_block(make_gauss_pulse(flip_angle=1))
+    seq.add_block(make_adc(num_samples=64, dwell=10e-6))
+    seq.add_block(make_adc(num_samples=32, dwell=10e-6, phase_offset=0.5))
+    assert seq.plot() is None
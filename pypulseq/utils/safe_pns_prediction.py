@@ -38,7 +38,6 @@
 from types import SimpleNamespace
 
 import numpy as np
-import matplotlib.pyplot as plt
 
 
 def safe_example_hw():
@@ -337,6 +336,7 @@ def safe_plot(pns, dt=None, envelope=True, envelope_points=500):
     # function h = safe_plot(pns, dt)
     # pns is relative PNS waveform (nx3)
     # dt is time step size in seconds.
+    import matplotlib.pyplot as plt
         
     pnsnorm = np.sqrt((pns**2).sum(axis=1))
     